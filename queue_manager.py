@@ -3,19 +3,125 @@ Chrome Queue Manager
 Automates opening multiple Chrome tabs, clearing cookies, and finding the lowest queue position
 """
 
+import sys
 import time
 import re
+import json
+import threading
+from collections import deque, namedtuple
+from dataclasses import dataclass
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, JavascriptException
+
+try:
+    # Used to talk to each tab's DevTools endpoint directly (optional)
+    import websocket
+except ImportError:
+    websocket = None
+
+# Lowest queue number of a tab that shows none (an int, so comparisons stay int-to-int)
+_NO_MATCH = sys.maxsize
+
+
+class _CDPSession:
+    """
+    A persistent DevTools connection to a single tab
+
+    Each tab gets its own connection, so commands for different tabs can run in
+    parallel threads without going through chromedriver or switching windows.
+    Commands on one connection are serialized with a lock.
+    """
+
+    def __init__(self, websocket_url, timeout=10):
+        self._ws = websocket.create_connection(websocket_url, timeout=timeout, suppress_origin=True)
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self.events = deque(maxlen=100)  # Events received while waiting for replies
+
+    def send(self, method, params=None, timeout=10):
+        """
+        Send a CDP command and wait for its reply
+
+        Args:
+            method (str): CDP method, e.g. "Runtime.evaluate"
+            params (dict): Command parameters
+            timeout (int): Seconds to wait for the reply
+
+        Returns:
+            dict: The command's result
+        """
+        with self._lock:
+            self._next_id += 1
+            message_id = self._next_id
+            self._ws.settimeout(timeout)
+            self._ws.send(json.dumps({'id': message_id, 'method': method, 'params': params or {}}))
+            while True:
+                message = json.loads(self._ws.recv())
+                if message.get('id') == message_id:
+                    break
+                if 'method' in message:
+                    self.events.append(message)
+
+        if 'error' in message:
+            raise RuntimeError(message['error'].get('message', 'CDP error'))
+        return message['result']
+
+    def wait_for_event(self, method, timeout=10):
+        """
+        Wait for a CDP event (its domain must be enabled)
+
+        Args:
+            method (str): Event name, e.g. "Page.loadEventFired"
+            timeout (int): Seconds to wait
+
+        Returns:
+            dict: The event's parameters
+        """
+        with self._lock:
+            for event in list(self.events):
+                if event['method'] == method:
+                    self.events.remove(event)
+                    return event.get('params', {})
+            self._ws.settimeout(timeout)
+            while True:
+                message = json.loads(self._ws.recv())
+                if message.get('method') == method:
+                    return message.get('params', {})
+
+    def close(self):
+        """Close the connection"""
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+
+@dataclass
+class TabState:
+    """Latest scan result for one tab, updated in place by every scan"""
+    __slots__ = ('tab_handle', 'url', 'lowest_queue', 'queue_numbers')
+
+    tab_handle: str
+    url: str
+    lowest_queue: int
+    queue_numbers: list
+
+
+# Result of scanning every tab: the TabState list plus the tab with the lowest queue number,
+# tracked while scanning (best_idx is None if no tab shows a number)
+ScanResult = namedtuple('ScanResult', ['data', 'best_idx', 'best_val'])
 
 
 class QueueManager:
-    def __init__(self, url, num_tabs=5, chrome_profile_path=None):
+    def __init__(self, url, num_tabs=5, chrome_profile_path=None, queue_pattern=r'queue[:\s]+(\d+)',
+                 queue_selector=None, fast_mode=True):
         """
         Initialize the Queue Manager
 
@@ -23,11 +129,24 @@ class QueueManager:
             url (str): The URL to open in multiple tabs
             num_tabs (int): Number of tabs to open
             chrome_profile_path (str): Path to Chrome profile (optional)
+            queue_pattern (str): Regex pattern to find queue numbers
+            queue_selector (str): CSS selector of the element holding the queue number (optional,
+                                  reads just that element instead of matching queue_pattern on the whole page)
+            fast_mode (bool): Add Chrome flags that keep background tabs running at full speed
+                              and skip work unrelated to queue scanning
         """
         self.url = url
         self.num_tabs = num_tabs
+        self._origin = self._url_origin(url)
         self.driver = None
         self.tabs = []
+        self._tab_states = []  # TabState per tab, reused across scans
+        self._tab_index = {}  # Window handle -> position in self.tabs
+        self._body_ready = set()  # Handles of tabs whose <body> has already been seen
+        self._sessions = {}  # Window handle -> _CDPSession
+        self._wait_sessions = {}  # Window handle -> _CDPSession kept for long in-page waits
+        self.queue_selector = queue_selector
+        self._set_queue_pattern(queue_pattern)
 
         # Setup Chrome options
         self.chrome_options = Options()
@@ -41,13 +160,29 @@ class QueueManager:
 
         # Prevent Chrome from restoring previous session
         self.chrome_options.add_argument("--disable-session-crashed-bubble")
-        self.chrome_options.add_argument("--disable-infobars")
         self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
 
         # Start with a blank page instead of restoring session
         self.chrome_options.add_argument("--no-first-run")
         self.chrome_options.add_argument("--no-default-browser-check")
 
+        if fast_mode:
+            # Only the focused tab runs timers and rendering at full speed by default, which
+            # leaves the queue countdown in every other tab stale when it is scanned
+            self.chrome_options.add_argument("--disable-renderer-backgrounding")
+            self.chrome_options.add_argument("--disable-background-timer-throttling")
+            self.chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+            # Skip background work that has nothing to do with the queue pages
+            self.chrome_options.add_argument("--disable-background-networking")
+            self.chrome_options.add_argument("--disable-features=TranslateUI")
+            self.chrome_options.add_argument("--disable-dev-shm-usage")
+            if not chrome_profile_path:
+                # A clean profile has no extensions worth loading (Cookie-Editor needs a profile)
+                self.chrome_options.add_argument("--disable-extensions")
+
+        # Return from navigation at DOMContentLoaded instead of waiting for every subresource
+        self.chrome_options.page_load_strategy = 'eager'
+
         # Optional: Run in background (comment out if you want to see the browser)
         # self.chrome_options.add_argument('--headless')
 
@@ -62,6 +197,131 @@ class QueueManager:
         }
         self.chrome_options.add_experimental_option("prefs", prefs)
 
+    @staticmethod
+    def _url_origin(url):
+        """Return the scheme://host[:port] origin of an http(s) URL, or None for other URLs"""
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https'):
+            return None
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    @staticmethod
+    def _literal_prefix(pattern):
+        """
+        Return the literal text every match of the pattern must start with, lowercased
+
+        Args:
+            pattern (str): Regex pattern
+
+        Returns:
+            str: Required prefix, or None if the pattern doesn't start with plain text
+        """
+        if '|' in pattern:
+            return None
+        match = re.match(r'[A-Za-z0-9]+', pattern)
+        if not match:
+            return None
+        prefix = match.group()
+        if pattern[match.end():match.end() + 1] in ('?', '*', '{'):
+            # The last character is quantified and may not appear at all
+            prefix = prefix[:-1]
+        return prefix.lower() or None
+
+    def _set_queue_pattern(self, queue_pattern):
+        """
+        Compile the queue pattern once, both for Python and as an in-page JavaScript scan
+
+        Args:
+            queue_pattern (str): Regex pattern to find queue numbers
+        """
+        self.queue_pattern = queue_pattern
+        # Python fallback, used when the pattern is not valid JavaScript
+        self._queue_re = re.compile(queue_pattern, re.IGNORECASE | re.DOTALL)
+        self._queue_prefix = self._literal_prefix(queue_pattern)
+        self._js_pattern_ok = True  # Cleared once the browser rejects the pattern
+        if self.queue_selector:
+            # Read the first number from the matching element(s); separators are only allowed
+            # between groups of three digits, so "12 5 minutes" or "3.5" aren't glued together
+            self._js_scan = (
+                f"var els=document.querySelectorAll({json.dumps(self.queue_selector)});"
+                "var out=[];"
+                "for(var i=0;i<els.length;i++){"
+                "var m=els[i].textContent.match(/\\d{1,3}(?:[,.\\u00a0 ]\\d{3})+|\\d+/);"
+                "if(m)out.push(m[0].replace(/\\D/g,''));"
+                "}"
+                "return out;"
+            )
+        else:
+            # Collect every match of the first capture group (or the whole match), like re.findall
+            self._js_scan = (
+                f"var re=new RegExp({json.dumps(queue_pattern)},'gis');"
+                "var text=document.body?document.body.innerText:'';"
+                "var out=[],m;"
+                "while((m=re.exec(text))!==null){"
+                "out.push(m.length>1?m[1]:m[0]);"
+                "if(!m[0].length)re.lastIndex++;"
+                "}"
+                "return out;"
+            )
+        # Installs (once per document) a MutationObserver that re-runs the scan when the page
+        # changes, keeping the latest matches in window.__queueFound. Bursts of mutations are
+        # scanned at most every 250 ms (innerText forces a layout), and the observer disconnects
+        # and removes itself as soon as a number is found, so it stops costing anything once it
+        # has done its job (a later watch installs a fresh one).
+        self._js_observe = (
+            f"var key={json.dumps(self._js_scan)};"
+            "if(!window.__queueObserver||window.__queueScanKey!==key){"
+            "if(window.__queueObserver)window.__queueObserver.disconnect();"
+            "window.__queueScanKey=key;"
+            "window.__queueWaiters=window.__queueWaiters||[];"
+            f"var scan=function(){{{self._js_scan}}};"
+            "var pending=false,observer;"
+            "var check=function(){"
+            "pending=false;"
+            "if(window.__queueObserver!==observer)return;"  # Replaced or stopped in the meantime
+            "var out=scan();"
+            "window.__queueFound=out.length?out:null;"
+            "if(window.__queueFound){"
+            # Forget the observer so the next watch reinstalls it, whose first scan replaces
+            # __queueFound, rather than trusting a number that may since have disappeared
+            "observer.disconnect();window.__queueObserver=null;"
+            "var waiters=window.__queueWaiters;window.__queueWaiters=[];"
+            "waiters.forEach(function(cb){cb(true);});"
+            "}"
+            "};"
+            "observer=new MutationObserver(function(){"
+            "if(!pending){pending=true;setTimeout(check,250);}"
+            "});"
+            "window.__queueObserver=observer;"
+            "observer.observe(document.documentElement,{subtree:true,childList:true,characterData:true});"
+            "check();"
+            "}"
+        )
+        # Body of function(ms): resolves true as soon as a queue number is on the page (false after ms).
+        # A waiter that times out removes itself, so repeated waits don't pile up in the page
+        self._js_watch = (
+            self._js_observe +
+            "return new Promise(function(resolve){"
+            "if(window.__queueFound)return resolve(true);"
+            "var timer,waiter=function(found){clearTimeout(timer);resolve(found);};"
+            "timer=setTimeout(function(){"
+            "var i=window.__queueWaiters.indexOf(waiter);"
+            "if(i>=0)window.__queueWaiters.splice(i,1);"
+            "resolve(false);"
+            "},ms);"
+            "window.__queueWaiters.push(waiter);"
+            "});"
+        )
+        # Resolves every open watch with false, ending the waits nobody needs any more
+        self._js_cancel_waits = (
+            "(function(){var waiters=window.__queueWaiters||[];window.__queueWaiters=[];"
+            "waiters.forEach(function(cb){cb(false);});})()"
+        )
+        # Disconnects the observer once monitoring is over (the next watch installs a new one)
+        self._js_stop = (
+            "if(window.__queueObserver){window.__queueObserver.disconnect();window.__queueObserver=null;}"
+        )
+
     def start_browser(self):
         """Initialize the Chrome browser"""
         print("Starting Chrome browser...")
@@ -69,42 +329,190 @@ class QueueManager:
         self.driver.maximize_window()
         print("Browser started successfully!")
 
+    def _wait_ready(self, timeout=10, reloaded=False):
+        """
+        Block until the current tab's document has been parsed (DOMContentLoaded)
+
+        Matches the "eager" page load strategy: queue pages show the number long
+        before images, fonts and analytics finish loading.
+
+        Args:
+            timeout (int): Maximum seconds to wait before giving up
+            reloaded (bool): Also wait for the document that set window.__queueReloading
+                             to be replaced, for reloads started without waiting
+
+        Returns:
+            bool: True if the page is ready, False on timeout
+        """
+        script = "return document.readyState != 'loading'"
+        if reloaded:
+            script += " && !window.__queueReloading"
+        try:
+            # The page may be mid-navigation while polling, so script errors just mean "not yet"
+            WebDriverWait(self.driver, timeout, ignored_exceptions=(JavascriptException,)).until(
+                lambda d: d.execute_script(script)
+            )
+            return True
+        except TimeoutException:
+            return False
+
     def open_tabs(self):
-        """Open multiple tabs with the target URL"""
+        """
+        Open multiple tabs with the target URL
+
+        The additional tabs are opened by a single script, which starts all their
+        navigations at once without switching focus or waiting for each page to
+        load. Any tab the browser didn't open is created over CDP instead.
+        """
         print(f"Opening {self.num_tabs} tabs...")
 
         # First tab
         self.driver.get(self.url)
+        self._wait_ready()
         self.tabs.append(self.driver.current_window_handle)
 
-        # Additional tabs
-        for i in range(1, self.num_tabs):
-            self.driver.execute_script("window.open('');")
-            self.driver.switch_to.window(self.driver.window_handles[i])
-            self.driver.get(self.url)
-            self.tabs.append(self.driver.current_window_handle)
-            print(f"Opened tab {i + 1}/{self.num_tabs}")
+        # Additional tabs, all in one round trip ('noopener' keeps them independent of the first tab)
+        if self.num_tabs > 1:
+            previous_handles = set(self.driver.window_handles)
+            self.driver.execute_script(
+                "for(var i=0;i<arguments[1];i++)window.open(arguments[0],'_blank','noopener');",
+                self.url, self.num_tabs - 1
+            )
+
+            def opened(driver):
+                # Hand back the new handles from the same poll that saw them, so they aren't fetched again
+                handles = [h for h in driver.window_handles if h not in previous_handles]
+                return handles if len(handles) >= self.num_tabs - 1 else False
+
+            try:
+                new_handles = WebDriverWait(self.driver, 10).until(opened)
+            except TimeoutException:
+                new_handles = [h for h in self.driver.window_handles if h not in previous_handles]
+            for handle in new_handles[:self.num_tabs - 1]:
+                self.tabs.append(handle)
+                print(f"Opened tab {len(self.tabs)}/{self.num_tabs}")
 
+        # Create any missing tabs one at a time (the target ID doubles as the window handle)
+        try:
+            while len(self.tabs) < self.num_tabs:
+                target = self.driver.execute_cdp_cmd("Target.createTarget", {
+                    "url": self.url,
+                    "background": True
+                })
+                self.tabs.append(target['targetId'])
+                print(f"Opened tab {len(self.tabs)}/{self.num_tabs}")
+        except Exception as e:
+            print(f"CDP unavailable ({str(e)}), opening remaining tabs one by one")
+            for i in range(len(self.tabs), self.num_tabs):
+                # Opens and focuses the new tab without listing every window handle
+                self.driver.switch_to.new_window('tab')
+                self.driver.get(self.url)
+                self._wait_ready()
+                self.tabs.append(self.driver.current_window_handle)
+                print(f"Opened tab {i + 1}/{self.num_tabs}")
+
+        self._tab_states = [TabState(tab, '', _NO_MATCH, []) for tab in self.tabs]
+        self._tab_index = {tab: i for i, tab in enumerate(self.tabs)}
+        self._body_ready = set()
+        self._open_sessions()
         print(f"All {self.num_tabs} tabs opened!")
 
+    def _page_origins(self):
+        """
+        Collect the origins loaded in the open tabs (plus the target URL's origin) in one CDP call
+
+        Returns:
+            set: Origins such as "https://example.com"
+        """
+        origins = {self._origin} - {None}
+        for target in self.driver.execute_cdp_cmd("Target.getTargets", {})['targetInfos']:
+            if target['type'] == 'page' and target['targetId'] in self.tabs:
+                origin = self._url_origin(target['url'])
+                if origin:
+                    origins.add(origin)
+        return origins
+
+    def _fast_clear(self, origins=None, session=None):
+        """
+        Clear cookies and local storage for every tab at once over CDP
+
+        Cookies and local storage are shared by all tabs on an origin, so one
+        Storage.clearDataForOrigin call per origin replaces the per-tab Selenium calls.
+        Session storage belongs to each tab and is not cleared here.
+
+        Args:
+            origins (set): Origins to clear (defaults to every origin open in the tabs)
+            session (_CDPSession): Tab connection to send the commands on, skipping
+                                   chromedriver (falls back to the driver if the tab rejects them)
+        """
+        if origins is None:
+            origins = self._page_origins()
+        send = self.driver.execute_cdp_cmd if session is None else session.send
+        for origin in origins:
+            params = {"origin": origin, "storageTypes": "cookies,local_storage"}
+            try:
+                send("Storage.clearDataForOrigin", params)
+            except RuntimeError:
+                # The tab's connection doesn't expose the Storage domain
+                self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", params)
+
     def delete_cookies(self):
         """
-        Delete cookies, local storage, and session storage using Selenium's built-in method
+        Delete cookies, local storage, and session storage from all tabs
+
+        Cookies and local storage are cleared once over CDP, falling back to
+        Selenium's built-in method per tab if CDP is unavailable.
         """
         print("Deleting cookies, local storage, and session storage from all tabs...")
+        try:
+            self._fast_clear()
+            cleared_shared = True
+            print("Cleared cookies and local storage for all tabs")
+        except Exception as e:
+            print(f"CDP clear failed ({str(e)}), deleting cookies tab by tab")
+            cleared_shared = False
+
+        if cleared_shared and websocket is not None:
+            # Only session storage is left, clear it in every tab at once
+            futures = self._map_tabs(lambda tab: self._cdp_evaluate(tab, "window.sessionStorage.clear()"))
+            log = []  # Per-tab lines, written out in one go
+            for i, future in enumerate(futures):
+                if future.exception():
+                    log.append(f"Tab {i + 1}: Cookies deleted (storage clear failed: {str(future.exception())})")
+                else:
+                    log.append(f"Tab {i + 1}: Cleared cookies, local storage, and session storage")
+            self._flush_log(log)
+            return
+
+        # Cookies are shared by every tab on an origin, so they only need deleting once per origin
+        cookies_cleared = set()
+        log = []
         for i, tab in enumerate(self.tabs):
             self.driver.switch_to.window(tab)
 
-            # Delete cookies
-            self.driver.delete_all_cookies()
-
-            # Clear local storage and session storage
+            # Clear local storage and session storage (the same call reports the tab's origin)
+            origin = None
             try:
-                self.driver.execute_script("window.localStorage.clear();")
-                self.driver.execute_script("window.sessionStorage.clear();")
-                print(f"Tab {i + 1}: Cleared cookies, local storage, and session storage")
+                if cleared_shared:
+                    self.driver.execute_script("window.sessionStorage.clear();")
+                else:
+                    origin = self.driver.execute_script(
+                        "window.localStorage.clear(); window.sessionStorage.clear(); return location.origin;"
+                    )
+                storage_error = None
             except Exception as e:
-                print(f"Tab {i + 1}: Cookies deleted (storage clear failed: {str(e)})")
+                storage_error = e
+
+            # Delete cookies
+            if not cleared_shared and (origin is None or origin not in cookies_cleared):
+                self.driver.delete_all_cookies()
+                cookies_cleared.add(origin)
+
+            if storage_error is None:
+                log.append(f"Tab {i + 1}: Cleared cookies, local storage, and session storage")
+            else:
+                log.append(f"Tab {i + 1}: Cookies deleted (storage clear failed: {str(storage_error)})")
+        self._flush_log(log)
 
     def delete_cookies_with_extension(self, extension_id=None, wait_time=3):
         """
@@ -123,18 +531,17 @@ class QueueManager:
                 if extension_id:
                     # Open Cookie-Editor extension popup directly
                     extension_url = f"chrome-extension://{extension_id}/popup.html"
+                    previous_handles = set(self.driver.window_handles)
                     self.driver.execute_script(f"window.open('{extension_url}', '_blank');")
 
-                    # Switch to the extension popup window
-                    time.sleep(1)
-                    popup_handle = self.driver.window_handles[-1]
+                    # Switch to the extension popup window as soon as it exists
+                    new_handles = WebDriverWait(self.driver, wait_time).until(
+                        lambda d: set(d.window_handles) - previous_handles
+                    )
+                    popup_handle = new_handles.pop()
                     self.driver.switch_to.window(popup_handle)
 
-                    # Wait for popup to load
-                    time.sleep(wait_time)
-
                     # Try multiple selectors for the delete button
-                    delete_button = None
                     selectors = [
                         # Try different possible selectors
                         (By.XPATH, "//button[contains(text(), 'Delete')]"),
@@ -148,16 +555,27 @@ class QueueManager:
                         (By.CSS_SELECTOR, "[data-action='delete-all']"),
                     ]
 
-                    for by, selector in selectors:
-                        try:
-                            delete_button = WebDriverWait(self.driver, 2).until(
-                                EC.element_to_be_clickable((by, selector))
-                            )
-                            delete_button.click()
-                            print(f"Tab {i + 1}: Successfully clicked delete button using selector: {selector}")
-                            break
-                        except:
-                            continue
+                    # Probe every selector and click the first visible match in one script,
+                    # retrying until the popup has rendered or wait_time runs out
+                    click_script = (
+                        "var selectors=arguments[0];"
+                        "for(var i=0;i<selectors.length;i++){"
+                        "var by=selectors[i][0],sel=selectors[i][1],el;"
+                        f"if(by==='{By.XPATH}')"
+                        "el=document.evaluate(sel,document,null,XPathResult.FIRST_ORDERED_NODE_TYPE,null)"
+                        ".singleNodeValue;"
+                        "else el=document.querySelector(sel);"
+                        "if(el&&el.offsetParent!==null&&!el.disabled){el.click();return sel;}"
+                        "}"
+                        "return null;"
+                    )
+                    try:
+                        delete_button = WebDriverWait(self.driver, wait_time).until(
+                            lambda d: d.execute_script(click_script, selectors)
+                        )
+                        print(f"Tab {i + 1}: Successfully clicked delete button using selector: {delete_button}")
+                    except TimeoutException:
+                        delete_button = None
 
                     if not delete_button:
                         print(f"Tab {i + 1}: Could not find delete button with any selector")
@@ -166,8 +584,7 @@ class QueueManager:
                         self.driver.close()
                         self.driver.switch_to.window(tab)
                         self.driver.delete_all_cookies()
-                        self.driver.execute_script("window.localStorage.clear();")
-                        self.driver.execute_script("window.sessionStorage.clear();")
+                        self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
                     else:
                         # Wait a moment for deletion to complete
                         time.sleep(0.5)
@@ -190,153 +607,631 @@ class QueueManager:
                 print(f"Tab {i + 1}: Falling back to Selenium delete_all_cookies()")
                 self.driver.switch_to.window(tab)
                 self.driver.delete_all_cookies()
-                self.driver.execute_script("window.localStorage.clear();")
-                self.driver.execute_script("window.sessionStorage.clear();")
+                self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
 
     def refresh_all_tabs(self, delay_between_refreshes=2, clear_cookies_before_refresh=False):
         """
         Refresh all opened tabs with delay between each
 
+        With no delay, all tabs are reloaded at once and the wait for them to load overlaps.
+
         Args:
             delay_between_refreshes (int): Seconds to wait between refreshing each tab
             clear_cookies_before_refresh (bool): Clear cookies/storage right before each individual refresh
+
+        Returns:
+            ScanResult: Scan of the freshly loaded tabs, or None if not every tab could be scanned as it reloaded
         """
         print("Refreshing all tabs...")
-        for i, tab in enumerate(self.tabs):
-            self.driver.switch_to.window(tab)
 
-            # Optionally clear cookies right before refresh for this specific tab
+        # Look up the origins to clear once, rather than before every refresh
+        origins = None
+        if clear_cookies_before_refresh:
+            try:
+                origins = self._page_origins()
+            except Exception as e:
+                print(f"CDP unavailable ({str(e)}), deleting cookies tab by tab")
+
+        # Drive each tab over its own DevTools connection instead of switching windows
+        use_cdp = websocket is not None and (origins is not None or not clear_cookies_before_refresh)
+
+        if delay_between_refreshes <= 0 and use_cdp:
+            # Nothing has to happen between refreshes, so reload every tab at once
             if clear_cookies_before_refresh:
-                self.driver.delete_all_cookies()
-                try:
-                    self.driver.execute_script("window.localStorage.clear();")
-                    self.driver.execute_script("window.sessionStorage.clear();")
-                except:
-                    pass
-                print(f"Tab {i + 1}: Cleared cookies/storage before refresh")
+                self._fast_clear(origins)
+            futures = self._map_tabs(lambda tab: self._process_tab(tab, clear_storage=clear_cookies_before_refresh))
+            all_scanned = True
+            best_idx, best_val = None, _NO_MATCH
+            log = []  # Per-tab lines, written out in one go
+            failed = []
+            for i, future in enumerate(futures):
+                if future.exception():
+                    log.append(f"Tab {i + 1}: Error refreshing - {str(future.exception())}")
+                    failed.append(i)
+                    all_scanned = False
+                    continue
+                ready, scanned, lines = future.result()
+                log.extend(lines)
+                if not ready:
+                    log.append(f"Tab {i + 1}: Timeout waiting for page to load after refresh")
+                log.append(f"Refreshed tab {i + 1}")
+                all_scanned = all_scanned and scanned
+                if scanned and self._tab_states[i].lowest_queue < best_val:
+                    best_idx, best_val = i, self._tab_states[i].lowest_queue
+            self._flush_log(log)
+
+            # The DevTools connection failed before these tabs were reloaded, so clear
+            # and refresh them through the driver like the staggered path does. Cookies and
+            # local storage were cleared for every tab above (clearing them again now would hit
+            # the tabs that just reloaded), so only the tab's own session storage is left.
+            for i in failed:
+                self.driver.switch_to.window(self.tabs[i])
+                if clear_cookies_before_refresh:
+                    try:
+                        self.driver.execute_script("window.sessionStorage.clear();")
+                    except Exception:
+                        pass
+                    print(f"Tab {i + 1}: Cleared cookies/storage before refresh")
+                self.driver.refresh()
+                if not self._wait_ready():
+                    print(f"Tab {i + 1}: Timeout waiting for page to load after refresh")
+                print(f"Refreshed tab {i + 1}")
+            return ScanResult(self._tab_states, best_idx, best_val) if all_scanned else None
+
+        if delay_between_refreshes <= 0:
+            # Start every reload without waiting for it, then wait for all of them together
+            for i, tab in enumerate(self.tabs):
+                self.driver.switch_to.window(tab)
+                if clear_cookies_before_refresh:
+                    self._clear_current_tab(i, origins)
+                self.driver.execute_script("window.__queueReloading = true; location.reload();")
+            log = []
+            for i, tab in enumerate(self.tabs):
+                self.driver.switch_to.window(tab)
+                if not self._wait_ready(reloaded=True):
+                    log.append(f"Tab {i + 1}: Timeout waiting for page to load after refresh")
+                log.append(f"Refreshed tab {i + 1}")
+            self._flush_log(log)
+            return None
+
+        all_scanned = use_cdp
+        best_idx, best_val = None, _NO_MATCH
 
-            self.driver.refresh()
+        for i, tab in enumerate(self.tabs):
+            refresh_start = time.time()
+            if use_cdp:
+                try:
+                    ready, scanned, lines = self._process_tab(tab, clear_storage=clear_cookies_before_refresh,
+                                                              origins=origins)
+                    self._flush_log(lines)
+                except Exception:
+                    # The DevTools connection failed before the reload, clear and refresh through the driver
+                    self.driver.switch_to.window(tab)
+                    if clear_cookies_before_refresh:
+                        self._clear_current_tab(i, origins)
+                    self.driver.refresh()
+                    ready, scanned = self._wait_ready(), False
+                all_scanned = all_scanned and scanned
+                if scanned and self._tab_states[i].lowest_queue < best_val:
+                    best_idx, best_val = i, self._tab_states[i].lowest_queue
+            else:
+                self.driver.switch_to.window(tab)
+                # Optionally clear cookies right before refresh for this specific tab
+                if clear_cookies_before_refresh:
+                    self._clear_current_tab(i, origins)
+                self.driver.refresh()
+                ready = self._wait_ready()
+            if not ready:
+                print(f"Tab {i + 1}: Timeout waiting for page to load after refresh")
             print(f"Refreshed tab {i + 1}")
             if i < len(self.tabs) - 1:  # Don't wait after the last tab
-                print(f"Waiting {delay_between_refreshes} seconds before next refresh...")
-                time.sleep(delay_between_refreshes)
+                # The stagger is a rate limit, so time spent loading counts towards it
+                remaining = delay_between_refreshes - (time.time() - refresh_start)
+                if remaining > 0:
+                    print(f"Waiting {remaining:.1f} seconds before next refresh...")
+                    time.sleep(remaining)
+
+        return ScanResult(self._tab_states, best_idx, best_val) if all_scanned else None
+
+    def _clear_current_tab(self, index, origins=None):
+        """
+        Clear cookies and storage for the tab the driver is focused on
+
+        Args:
+            index (int): Position of the tab in self.tabs
+            origins (set): Origins to clear over CDP (None to use Selenium's delete_all_cookies)
+        """
+        if origins is not None:
+            self._fast_clear(origins)
+        else:
+            self.driver.delete_all_cookies()
+        try:
+            if origins is not None:
+                self.driver.execute_script("window.sessionStorage.clear();")
+            else:
+                self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except:
+            pass
+        print(f"Tab {index + 1}: Cleared cookies/storage before refresh")
+
+    def _process_tab(self, tab, clear_storage=False, origins=None, timeout=10):
+        """
+        Clear, reload, and scan one tab in a single pass over its DevTools connection
+
+        Storage is cleared, the tab is reloaded, and the fresh page is scanned
+        (with its queue observer installed) without ever switching the driver's
+        focus or going through chromedriver. Errors are only raised if the
+        connection fails before the reload is sent; a failed scan afterwards
+        just leaves the tab unscanned.
 
-    def scan_queue_numbers(self, queue_pattern=r'queue[:\s]+(\d+)', timeout=10):
+        Args:
+            tab (str): Window handle (DevTools target ID) of the tab
+            clear_storage (bool): Clear the tab's session storage before reloading
+            origins (set): Origins whose cookies and local storage to clear first
+                           (shared by all tabs, so None when the caller already cleared them)
+            timeout (int): Seconds to wait for the page to load
+
+        Returns:
+            tuple: (ready, scanned, lines) - whether the page loaded before the timeout,
+                   whether its TabState was updated, and the tab's status lines for the
+                   caller to print (so parallel tabs don't interleave their output)
+        """
+        index = self._tab_index[tab]
+        lines = []
+        scan_expression = (
+            f"(function(){{{self._js_observe}"
+            f"return {{url:location.href,matches:(function(){{{self._js_scan}}})()}};}})()"
+        )
+
+        def process(session):
+            if origins:
+                self._fast_clear(origins, session)
+            if clear_storage:
+                session.send("Runtime.evaluate", {'expression': "window.sessionStorage.clear()"})
+                lines.append(f"Tab {index + 1}: Cleared cookies/storage before refresh")
+
+            session.send("Page.enable")
+            session.events.clear()
+            session.send("Page.reload")
+
+            # The tab holds its new queue position from here on, so a failure below must not
+            # make the caller clear and reload it again
+            ready = False
+            try:
+                try:
+                    session.wait_for_event("Page.domContentEventFired", timeout=timeout)
+                    ready = True
+                except websocket.WebSocketTimeoutException:
+                    pass
+                return ready, scan(session), lines
+            except Exception as e:
+                if isinstance(e, (OSError, websocket.WebSocketException)):
+                    # Connection dropped, reconnect next time
+                    self._drop_session(tab)
+                lines.append(f"Tab {index + 1}: Error scanning after refresh - {str(e)}")
+                return ready, False, lines
+
+        def scan(session):
+            if not self._js_pattern_ok:
+                return False
+            # A reload starts a new document, so watch it for the queue number and scan it right away
+            result = session.send("Runtime.evaluate", {'expression': scan_expression, 'returnByValue': True},
+                                  timeout=timeout)
+            if 'exceptionDetails' in result:
+                details = result['exceptionDetails']
+                if 'Invalid regular expression' in details.get('exception', {}).get('description', ''):
+                    self._js_pattern_ok = False
+                return False
+            value = result['result'].get('value') or {}
+            queue_numbers = [int(match) for match in value.get('matches') or []]
+            if queue_numbers:
+                lines.append(f"Tab {index + 1}: Found queue number(s): {queue_numbers}")
+            self._update_tab_state(index, queue_numbers, value.get('url', ''))
+            return True
+
+        return self._with_tab(tab, process)
+
+    @staticmethod
+    def _flush_log(lines):
+        """
+        Print the lines collected by a per-tab loop with a single write
+
+        Args:
+            lines (list): Lines to print
+        """
+        if lines:
+            print("\n".join(lines))
+
+    def _update_tab_state(self, index, queue_numbers, url):
+        """
+        Record a tab's scan result in its pre-allocated TabState
+
+        Args:
+            index (int): Position of the tab in self.tabs
+            queue_numbers (list): Queue numbers found (empty if none)
+            url (str): Tab URL, or 'timeout' / 'error'
+
+        Returns:
+            int: The tab's lowest queue number (_NO_MATCH if none)
+        """
+        state = self._tab_states[index]
+        state.queue_numbers = queue_numbers
+        state.lowest_queue = min(queue_numbers) if queue_numbers else _NO_MATCH
+        state.url = url
+        return state.lowest_queue
+
+    def _match_text(self, page_text):
+        """
+        Match the queue pattern against page text in Python
+
+        Args:
+            page_text (str): The page's visible text
+
+        Returns:
+            list: Matched strings, like re.findall
+        """
+        # Skip the regex entirely on pages that can't contain a match
+        if self._queue_prefix is not None and self._queue_prefix not in page_text.lower():
+            return []
+        return self._queue_re.findall(page_text)
+
+    def scan_queue_numbers(self, timeout=10):
         """
         Scan all tabs for queue numbers and return the lowest one
 
         Args:
-            queue_pattern (str): Regex pattern to find queue numbers
             timeout (int): How long to wait for page load
 
         Returns:
-            dict: Dictionary with tab index and queue numbers
+            ScanResult: TabState per tab, in tab order (updated in place by later scans), and the best tab
         """
         print("\nScanning for queue numbers...")
-        queue_data = {}
+        best_idx, best_val = None, _NO_MATCH
+        log = []  # Per-tab lines, written out in one go
 
         for i, tab in enumerate(self.tabs):
             self.driver.switch_to.window(tab)
 
             try:
-                # Wait for page to load
-                WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-
-                # Get page text
-                page_text = self.driver.find_element(By.TAG_NAME, "body").text
-
-                # Search for queue number using regex
-                matches = re.findall(queue_pattern, page_text, re.IGNORECASE)
-
-                if matches:
-                    # Convert to integers and get the first match (or all matches)
-                    queue_numbers = [int(match) for match in matches]
-                    queue_data[i] = {
-                        'tab_handle': tab,
-                        'queue_numbers': queue_numbers,
-                        'lowest_queue': min(queue_numbers),
-                        'url': self.driver.current_url
-                    }
-                    print(f"Tab {i + 1}: Found queue number(s): {queue_numbers}")
+                # Wait for page to load (only until the tab's first successful check,
+                # reloads already wait for the new document to be parsed)
+                if tab not in self._body_ready:
+                    WebDriverWait(self.driver, timeout).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "body"))
+                    )
+                    self._body_ready.add(tab)
+
+                # Search for queue number using regex inside the page, so only the
+                # matched numbers come back instead of the whole page text
+                # (the tab's URL comes back in the same call, rather than asking for current_url)
+                matches = None
+                if self._js_pattern_ok:
+                    try:
+                        url, matches = self.driver.execute_script(
+                            f"return [location.href,(function(){{{self._js_scan}}})()];"
+                        )
+                    except JavascriptException as e:
+                        if 'Invalid regular expression' in str(e):
+                            # Don't retry the in-page match on every tab and every scan
+                            self._js_pattern_ok = False
+
+                if matches is None:
+                    # Pattern is not valid JavaScript, match the page text in Python instead
+                    url, page_text = self.driver.execute_script("return [location.href,document.body.innerText];")
+                    matches = self._match_text(page_text)
+
+                # Convert to integers (all matches are kept)
+                queue_numbers = [int(match) for match in matches]
+                if queue_numbers:
+                    log.append(f"Tab {i + 1}: Found queue number(s): {queue_numbers}")
                 else:
-                    print(f"Tab {i + 1}: No queue number found")
-                    queue_data[i] = {
-                        'tab_handle': tab,
-                        'queue_numbers': [],
-                        'lowest_queue': float('inf'),
-                        'url': self.driver.current_url
-                    }
+                    log.append(f"Tab {i + 1}: No queue number found")
+                lowest = self._update_tab_state(i, queue_numbers, url)
+                if lowest < best_val:
+                    best_idx, best_val = i, lowest
 
             except TimeoutException:
-                print(f"Tab {i + 1}: Timeout waiting for page to load")
-                queue_data[i] = {
-                    'tab_handle': tab,
-                    'queue_numbers': [],
-                    'lowest_queue': float('inf'),
-                    'url': 'timeout'
-                }
+                log.append(f"Tab {i + 1}: Timeout waiting for page to load")
+                self._update_tab_state(i, [], 'timeout')
             except Exception as e:
-                print(f"Tab {i + 1}: Error scanning - {str(e)}")
-                queue_data[i] = {
-                    'tab_handle': tab,
-                    'queue_numbers': [],
-                    'lowest_queue': float('inf'),
-                    'url': 'error'
-                }
+                log.append(f"Tab {i + 1}: Error scanning - {str(e)}")
+                self._update_tab_state(i, [], 'error')
+
+        self._flush_log(log)
+        return ScanResult(self._tab_states, best_idx, best_val)
+
+    def _devtools_url(self, target_id):
+        """Return the DevTools websocket URL of a tab"""
+        debugger_address = self.driver.capabilities['goog:chromeOptions']['debuggerAddress']
+        return f"ws://{debugger_address}/devtools/page/{target_id}"
+
+    def _session(self, tab, waits=False):
+        """
+        Get the persistent DevTools connection for a tab, opening it on first use
+
+        Args:
+            tab (str): Window handle (DevTools target ID) of the tab
+            waits (bool): Get the tab's second connection, used for long in-page waits
+                          so they never hold up the shared one
 
-        return queue_data
+        Returns:
+            _CDPSession: The tab's connection
+        """
+        sessions = self._wait_sessions if waits else self._sessions
+        session = sessions.get(tab)
+        if session is None:
+            session = _CDPSession(self._devtools_url(tab))
+            sessions[tab] = session
+        return session
+
+    def _open_sessions(self):
+        """
+        Connect to every tab's DevTools endpoint at once, so the first scan or
+        refresh doesn't pay for opening the connections one tab at a time
+        """
+        if websocket is None:
+            return
+        futures = self._map_tabs(self._session)
+        failed = sum(1 for future in futures if future.exception())
+        if failed:
+            print(f"Could not connect to {failed}/{len(self.tabs)} tabs over DevTools (will retry on use)")
+
+    def _drop_session(self, tab, waits=False):
+        """Close a tab's DevTools connection so the next use reconnects"""
+        sessions = self._wait_sessions if waits else self._sessions
+        session = sessions.pop(tab, None)
+        if session is not None:
+            session.close()
+
+    def _close_sessions(self):
+        """Close all DevTools connections"""
+        for session in list(self._sessions.values()) + list(self._wait_sessions.values()):
+            session.close()
+        self._sessions = {}
+        self._wait_sessions = {}
+
+    def _with_tab(self, tab, func, waits=False):
+        """
+        Run func(session) against a tab's DevTools connection, without switching to the tab
+
+        Args:
+            tab (str): Window handle (DevTools target ID) of the tab
+            func (callable): Function taking the tab's _CDPSession
+            waits (bool): Use the tab's connection for long in-page waits
+
+        Returns:
+            Whatever func returns
+        """
+        session = self._session(tab, waits)
+        try:
+            return func(session)
+        except (OSError, websocket.WebSocketException):
+            # Connection dropped (e.g. the tab was closed), reconnect next time
+            self._drop_session(tab, waits)
+            raise
+
+    def _map_tabs(self, func, tabs=None):
+        """
+        Run func(tab) for every tab at the same time
+
+        Args:
+            func (callable): Function taking a window handle
+            tabs (list): Window handles (defaults to all tabs)
+
+        Returns:
+            list: Finished futures, in the same order as the tabs
+        """
+        tabs = self.tabs if tabs is None else tabs
+        with ThreadPoolExecutor(max_workers=len(tabs) or 1) as executor:
+            return [executor.submit(func, tab) for tab in tabs]
+
+    def _cdp_evaluate(self, target_id, expression, timeout=10, await_promise=False):
+        """
+        Evaluate a JavaScript expression in a tab over its own DevTools connection,
+        without switching the driver's focus to that tab
+
+        Args:
+            target_id (str): DevTools target ID of the tab (same as its window handle)
+            expression (str): JavaScript expression to evaluate
+            timeout (int): Socket timeout in seconds
+            await_promise (bool): Wait for a returned Promise to settle and return its value
+
+        Returns:
+            The JSON-serializable value of the expression
+        """
+        params = {'expression': expression, 'returnByValue': True, 'awaitPromise': await_promise}
+        # Long waits go over the tab's second connection so they never hold up the shared one
+        result = self._with_tab(
+            target_id, lambda session: session.send('Runtime.evaluate', params, timeout=timeout),
+            waits=await_promise
+        )
+
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            # 'text' is just "Uncaught" for thrown errors, the message is in the exception itself
+            message = details.get('exception', {}).get('description') or details.get('text', 'JavaScript error')
+            raise JavascriptException(message)
+        return result['result'].get('value')
+
+    def scan_queue_numbers_fast(self, timeout=10):
+        """
+        Scan all tabs for queue numbers in parallel over the Chrome DevTools Protocol
+
+        The regex runs inside each page and only the matched numbers are sent back,
+        so no tab has to be focused and no page text is serialized. If the pattern
+        is not valid JavaScript, the page text is fetched the same way and matched
+        in Python. Falls back to scan_queue_numbers() if a direct DevTools
+        connection is not available.
+
+        Args:
+            timeout (int): How long to wait for each tab to answer
+
+        Returns:
+            ScanResult: TabState per tab, in tab order (updated in place by later scans), and the best tab
+        """
+        if websocket is None:
+            return self.scan_queue_numbers(timeout=timeout)
+
+        # One Runtime.evaluate per tab returns both the matches and the tab's URL,
+        # so nothing has to go through chromedriver
+        if self._js_pattern_ok:
+            expression = f"({{url:location.href,matches:(function(){{{self._js_scan}}})()}})"
+        else:
+            expression = "({url:location.href,text:document.body?document.body.innerText:''})"
+
+        print("\nScanning for queue numbers...")
+        futures = self._map_tabs(lambda tab: self._cdp_evaluate(tab, expression, timeout=timeout))
+
+        if futures and all(future.exception() and not isinstance(future.exception(), JavascriptException)
+                           for future in futures):
+            print(f"CDP unavailable ({str(futures[0].exception())}), falling back to serial scan")
+            return self.scan_queue_numbers(timeout=timeout)
+
+        errors = [str(future.exception()) for future in futures
+                  if isinstance(future.exception(), JavascriptException)]
+        if self._js_pattern_ok and any('Invalid regular expression' in error for error in errors):
+            # Don't retry the in-page match, fetch the page text and match it in Python instead
+            self._js_pattern_ok = False
+            return self.scan_queue_numbers_fast(timeout=timeout)
+        if errors:
+            print("In-page scan failed, falling back to serial scan")
+            return self.scan_queue_numbers(timeout=timeout)
+
+        best_idx, best_val = None, _NO_MATCH
+        log = []  # Per-tab lines, written out in one go
+        for i, future in enumerate(futures):
+            try:
+                result = future.result()
+                if 'text' in result:
+                    matches = self._match_text(result['text'])
+                else:
+                    matches = result['matches'] or []
+                queue_numbers = [int(match) for match in matches]
+                if queue_numbers:
+                    log.append(f"Tab {i + 1}: Found queue number(s): {queue_numbers}")
+                else:
+                    log.append(f"Tab {i + 1}: No queue number found")
+                lowest = self._update_tab_state(i, queue_numbers, result['url'])
+                if lowest < best_val:
+                    best_idx, best_val = i, lowest
+            except Exception as e:
+                log.append(f"Tab {i + 1}: Error scanning - {str(e)}")
+                self._update_tab_state(i, [], 'error')
+
+        self._flush_log(log)
+        return ScanResult(self._tab_states, best_idx, best_val)
 
     def find_best_tab(self, queue_data):
         """
-        Find the tab with the lowest queue number
+        Switch to the tab with the lowest queue number
 
         Args:
-            queue_data (dict): Dictionary from scan_queue_numbers()
+            queue_data (ScanResult): Result of scan_queue_numbers(), with the best tab already tracked
 
         Returns:
             tuple: (tab_index, queue_number)
         """
-        if not queue_data:
+        if not queue_data or not queue_data.data:
             print("No queue data available!")
             return None, None
 
-        best_tab = min(queue_data.items(), key=lambda x: x[1]['lowest_queue'])
-        tab_index, data = best_tab
-
-        if data['lowest_queue'] == float('inf'):
+        tab_index = queue_data.best_idx
+        if tab_index is None:
             print("\nNo valid queue numbers found in any tab!")
             return None, None
 
+        state = queue_data.data[tab_index]
+
         print(f"\n{'='*50}")
         print(f"BEST TAB: Tab {tab_index + 1}")
-        print(f"Queue Position: {data['lowest_queue']}")
-        print(f"URL: {data['url']}")
+        print(f"Queue Position: {state.lowest_queue}")
+        print(f"URL: {state.url}")
         print(f"{'='*50}\n")
 
         # Switch to the best tab
-        self.driver.switch_to.window(data['tab_handle'])
+        self.driver.switch_to.window(state.tab_handle)
+
+        return tab_index, state.lowest_queue
+
+    def _stop_observers(self):
+        """Disconnect the in-page queue observers in every tab"""
+        if websocket is None:
+            return
+        # Best effort: tabs that can't be reached have nothing left running that matters
+        self._map_tabs(lambda tab: self._cdp_evaluate(tab, self._js_stop))
+
+    def _wait_for_queue_numbers(self, tabs, wait_time):
+        """
+        Block until a queue number appears in any of the given tabs, or wait_time passes
+
+        A MutationObserver inside each tab pushes the result as soon as the page
+        changes, so this returns within milliseconds of a number appearing instead
+        of sleeping for the whole interval. Falls back to a plain sleep if a direct
+        DevTools connection is not available.
 
-        return tab_index, data['lowest_queue']
+        Args:
+            tabs (list): Window handles of the tabs to watch
+            wait_time (float): Maximum seconds to wait
+
+        Returns:
+            bool: True if a tab reported a queue number before the deadline
+        """
+        deadline = time.time() + wait_time
 
-    def monitor_tabs_continuously(self, queue_pattern=r'queue[:\s]+(\d+)',
-                                   check_interval=5, max_attempts=None,
-                                   stop_on_first_find=False):
+        if websocket is not None and self._js_pattern_ok and tabs:
+            expression = f"(function(ms){{{self._js_watch}}})({int(wait_time * 1000)})"
+            executor = ThreadPoolExecutor(max_workers=len(tabs))
+            futures = [executor.submit(self._cdp_evaluate, tab, expression, wait_time + 5, True)
+                       for tab in tabs]
+            try:
+                for future in as_completed(futures, timeout=wait_time + 5):
+                    try:
+                        if future.result():
+                            return True
+                    except Exception:
+                        continue
+            except FuturesTimeoutError:
+                pass
+            finally:
+                # Resolve the in-page waits that are still open, so their connections
+                # are free again for the next attempt instead of blocking until the timer
+                pending = [tab for tab, future in zip(tabs, futures) if not future.done()]
+                if pending:
+                    self._map_tabs(lambda tab: self._cdp_evaluate(tab, self._js_cancel_waits), pending)
+                executor.shutdown(wait=False)
+
+        remaining = deadline - time.time()
+        if remaining > 0:
+            time.sleep(remaining)
+        return False
+
+    def monitor_tabs_continuously(self, check_interval=5, max_attempts=None, stop_on_first_find=False,
+                                  max_check_interval=30, queue_pattern=None, initial_scan=None):
         """
         Continuously monitor all tabs for queue numbers until they appear
 
+        While no tab shows a number, the wait between scans grows by 1.5x per empty
+        scan up to max_check_interval. The in-page observers still trigger a scan the
+        moment a number appears, so backing off only saves traffic.
+
         Args:
-            queue_pattern (str): Regex pattern to find queue numbers
-            check_interval (int): Seconds to wait between scans
+            check_interval (int): Maximum seconds to wait between scans (a scan runs as soon as a tab shows a number)
             max_attempts (int): Maximum number of scan attempts (None for unlimited)
             stop_on_first_find (bool): Stop monitoring once any queue number is found
+            max_check_interval (int): Longest wait between scans while backing off
+            queue_pattern (str): Switch to a different regex pattern (optional, only recompiled if it changed)
+            initial_scan (ScanResult): Scan already taken (e.g. by refresh_all_tabs) to use as the first attempt
 
         Returns:
-            dict: Final queue data from the last successful scan
+            ScanResult: Result of the last scan
         """
+        if queue_pattern is not None and queue_pattern != self.queue_pattern:
+            self._set_queue_pattern(queue_pattern)
+            initial_scan = None  # Taken with the old pattern
+
         attempt = 0
         found_any = False
+        empty_streak = 0
 
         print(f"\n{'='*50}")
         print("Starting continuous monitoring...")
@@ -347,121 +1242,223 @@ class QueueManager:
             print("Will monitor indefinitely until queue numbers found")
         print(f"{'='*50}\n")
 
-        while True:
-            attempt += 1
-            print(f"\n--- Scan Attempt {attempt} ---")
+        try:
+            while True:
+                attempt += 1
+                print(f"\n--- Scan Attempt {attempt} ---")
+
+                if attempt == 1 and initial_scan is not None:
+                    # Tabs whose number appeared since then wake the wait below straight away
+                    print("Using the scan taken while the tabs reloaded")
+                    queue_data = initial_scan
+                else:
+                    queue_data = self.scan_queue_numbers_fast()
+
+                wait_time = check_interval
+                # Check if any valid queue numbers were found
+                if queue_data.best_idx is not None:
+                    found_any = True
+                    empty_streak = 0
+                    num_found = sum(1 for state in queue_data.data if state.lowest_queue != _NO_MATCH)
+                    print(f"\n✓ Found queue numbers in {num_found}/{len(self.tabs)} tabs!")
+
+                    if stop_on_first_find:
+                        print("Stopping monitoring (stop_on_first_find=True)")
+                        return queue_data
+
+                    # Show summary of all found queues
+                    log = ["\nCurrent queue positions:"]
+                    for idx, state in enumerate(queue_data.data):
+                        if state.lowest_queue != _NO_MATCH:
+                            log.append(f"  Tab {idx + 1}: Queue {state.lowest_queue}")
+                        else:
+                            log.append(f"  Tab {idx + 1}: Waiting...")
+                    self._flush_log(log)
+
+                    # If all tabs have queue numbers, we're done
+                    if num_found == len(self.tabs):
+                        print("\n✓ All tabs now showing queue numbers!")
+                        return queue_data
+                else:
+                    if websocket is not None and self._js_pattern_ok:
+                        # Back off while the pages stay empty (only safe when observers can wake us early)
+                        longest = max(max_check_interval, check_interval)
+                        wait_time = min(check_interval * 1.5 ** empty_streak, longest)
+                        if wait_time < longest:
+                            empty_streak += 1  # Stop growing at the cap, 1.5 ** n overflows on long runs
+                    print(f"\nNo queue numbers found yet. Waiting up to {wait_time:.0f} seconds...")
+
+                # Check if we've reached max attempts
+                if max_attempts and attempt >= max_attempts:
+                    print(f"\nReached maximum attempts ({max_attempts})")
+                    if found_any:
+                        print("Returning partial results...")
+                    else:
+                        print("No queue numbers found in any attempt")
+                    return queue_data
 
-            queue_data = self.scan_queue_numbers(queue_pattern=queue_pattern)
+                # Wait before next scan, waking up early if a waiting tab shows a queue number
+                waiting_tabs = [state.tab_handle for state in queue_data.data
+                                if state.lowest_queue == _NO_MATCH]
+                self._wait_for_queue_numbers(waiting_tabs, wait_time)
+        finally:
+            # The observers only exist to cut monitoring waits short
+            self._stop_observers()
 
-            # Check if any valid queue numbers were found
-            valid_queues = [data for data in queue_data.values()
-                          if data['lowest_queue'] != float('inf')]
+    def setup(self):
+        """
+        Start the browser and open the tabs
 
-            if valid_queues:
-                found_any = True
-                num_found = len(valid_queues)
-                print(f"\n✓ Found queue numbers in {num_found}/{len(self.tabs)} tabs!")
+        Only needs to run once; the same browser can then be reused for
+        any number of cycles until shutdown() is called.
+        """
+        self.start_browser()  # Returns once the driver session is ready, no need to wait on the blank page
 
-                if stop_on_first_find:
-                    print("Stopping monitoring (stop_on_first_find=True)")
-                    return queue_data
+        self.open_tabs()  # Later steps wait for each tab to load
 
-                # Show summary of all found queues
-                print("\nCurrent queue positions:")
-                for idx, data in queue_data.items():
-                    if data['lowest_queue'] != float('inf'):
-                        print(f"  Tab {idx + 1}: Queue {data['lowest_queue']}")
-                    else:
-                        print(f"  Tab {idx + 1}: Waiting...")
+    def cycle(self, use_continuous_monitoring=True, check_interval=5, max_attempts=60,
+              use_cookie_editor=False, cookie_editor_id=None, pause_before_cookies=False,
+              clear_cookies_before_refresh=None, max_check_interval=30):
+        """
+        Run one cycle on the already open tabs: clear cookies, refresh, scan queues
 
-                # If all tabs have queue numbers, we're done
-                if num_found == len(self.tabs):
-                    print("\n✓ All tabs now showing queue numbers!")
-                    return queue_data
-            else:
-                print(f"\nNo queue numbers found yet. Waiting {check_interval} seconds...")
+        Args:
+            use_continuous_monitoring (bool): Use continuous monitoring instead of single scan
+            check_interval (int): Seconds between monitoring checks (if continuous monitoring enabled)
+            max_attempts (int): Maximum monitoring attempts (None for unlimited)
+            use_cookie_editor (bool): Use Cookie-Editor extension instead of Selenium's delete_all_cookies
+            cookie_editor_id (str): Extension ID for Cookie-Editor (find in chrome://extensions)
+            pause_before_cookies (bool): Pause before deleting cookies to allow manual setup (e.g., installing extensions)
+            clear_cookies_before_refresh (bool): Clear each tab right before its own refresh (True), or clear
+                                                 every tab once upfront with delete_cookies() or the extension
+                                                 (False). Defaults to False with the extension, True otherwise
+            max_check_interval (int): Longest wait between monitoring checks while no tab shows a number
+                                      (set it to check_interval to turn the backoff off)
 
-            # Check if we've reached max attempts
-            if max_attempts and attempt >= max_attempts:
-                print(f"\nReached maximum attempts ({max_attempts})")
-                if found_any:
-                    print("Returning partial results...")
-                else:
-                    print("No queue numbers found in any attempt")
-                return queue_data
+        Returns:
+            tuple: (tab_index, queue_number) of the best tab, or (None, None)
+        """
+        if pause_before_cookies:
+            print("\n" + "="*60)
+            print("PAUSED - Browser is ready for manual setup")
+            print("You can now:")
+            print("  - Install extensions (like Cookie-Editor)")
+            print("  - Configure browser settings")
+            print("  - Check chrome://extensions/ for extension IDs")
+            print("="*60)
+            input("\nPress Enter to continue with cookie deletion and scanning...")
+
+        # Clear either upfront or right before each refresh, never both: the second
+        # clear of every tab would be wasted work. The extension always clears upfront.
+        if clear_cookies_before_refresh is None:
+            clear_cookies_before_refresh = not use_cookie_editor
+        if use_cookie_editor and clear_cookies_before_refresh:
+            raise ValueError("use_cookie_editor clears every tab upfront, "
+                             "it can't be combined with clear_cookies_before_refresh=True")
+        if use_cookie_editor:
+            self.delete_cookies_with_extension(extension_id=cookie_editor_id)
+        elif not clear_cookies_before_refresh:
+            self.delete_cookies()
+
+        # Refresh tabs with individual cookie clearing and delays to get unique queue IDs
+        print("\nRefreshing tabs individually with delays to ensure unique queue positions...")
+        refresh_scan = self.refresh_all_tabs(delay_between_refreshes=3,
+                                             clear_cookies_before_refresh=clear_cookies_before_refresh)
+
+        if use_continuous_monitoring:
+            # Use continuous monitoring - keeps checking until queue numbers appear
+            # The refresh already scanned every tab, so monitoring starts from that scan
+            queue_data = self.monitor_tabs_continuously(
+                check_interval=check_interval,
+                max_attempts=max_attempts,
+                max_check_interval=max_check_interval,
+                initial_scan=refresh_scan
+            )
+        else:
+            # Single scan only (already done by the refresh as each tab reloaded, when it could)
+            queue_data = refresh_scan if refresh_scan is not None else self.scan_queue_numbers_fast()
+            # Monitoring stops its own observers, nothing else would stop the ones the refresh installed
+            self._stop_observers()
 
-            # Wait before next scan
-            time.sleep(check_interval)
+        return self.find_best_tab(queue_data)
 
-    def run_full_cycle(self, queue_pattern=r'queue[:\s]+(\d+)',
-                       use_continuous_monitoring=True, check_interval=5, max_attempts=60,
-                       use_cookie_editor=False, cookie_editor_id=None, pause_before_cookies=False):
+    def reset_tabs(self):
+        """
+        Close every tab except the first and open a fresh set on the same browser
+        """
+        print("\nResetting tabs...")
+        first_tab = self.tabs[0]
+        for tab in self.tabs[1:]:
+            try:
+                self.driver.execute_cdp_cmd("Target.closeTarget", {"targetId": tab})
+            except Exception:
+                self.driver.switch_to.window(tab)
+                self.driver.close()
+
+        self._close_sessions()
+        self.driver.switch_to.window(first_tab)
+        self.tabs = []
+        self.open_tabs()
+
+    def shutdown(self):
+        """Close the browser"""
+        self._close_sessions()
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+            self.tabs = []
+            print("Browser closed.")
+
+    def run_full_cycle(self, use_continuous_monitoring=True, check_interval=5, max_attempts=60,
+                       use_cookie_editor=False, cookie_editor_id=None, pause_before_cookies=False,
+                       clear_cookies_before_refresh=None, max_check_interval=30):
         """
         Run the complete cycle: open tabs, clear cookies, refresh, scan queues
 
+        After each cycle the browser stays open and another cycle can be run on
+        it without restarting Chrome.
+
         Args:
-            queue_pattern (str): Regex pattern to find queue numbers
             use_continuous_monitoring (bool): Use continuous monitoring instead of single scan
             check_interval (int): Seconds between monitoring checks (if continuous monitoring enabled)
             max_attempts (int): Maximum monitoring attempts (None for unlimited)
             use_cookie_editor (bool): Use Cookie-Editor extension instead of Selenium's delete_all_cookies
             cookie_editor_id (str): Extension ID for Cookie-Editor (find in chrome://extensions)
             pause_before_cookies (bool): Pause before deleting cookies to allow manual setup (e.g., installing extensions)
+            clear_cookies_before_refresh (bool): Clear each tab right before its own refresh (True), or clear
+                                                 every tab once upfront with delete_cookies() or the extension
+                                                 (False). Defaults to False with the extension, True otherwise
+            max_check_interval (int): Longest wait between monitoring checks while no tab shows a number
+                                      (set it to check_interval to turn the backoff off)
         """
         try:
-            self.start_browser()
-            time.sleep(2)  # Let browser initialize
-
-            self.open_tabs()
-            time.sleep(5)  # Wait for all tabs to fully load
-
-            if pause_before_cookies:
-                print("\n" + "="*60)
-                print("PAUSED - Browser is ready for manual setup")
-                print("You can now:")
-                print("  - Install extensions (like Cookie-Editor)")
-                print("  - Configure browser settings")
-                print("  - Check chrome://extensions/ for extension IDs")
-                print("="*60)
-                input("\nPress Enter to continue with cookie deletion and scanning...")
-
-            # Clear cookies once initially
-            if use_cookie_editor:
-                self.delete_cookies_with_extension(extension_id=cookie_editor_id)
-            else:
-                self.delete_cookies()
-            time.sleep(2)
-
-            # Refresh tabs with individual cookie clearing and delays to get unique queue IDs
-            print("\nRefreshing tabs individually with delays to ensure unique queue positions...")
-            self.refresh_all_tabs(delay_between_refreshes=3, clear_cookies_before_refresh=True)
-            time.sleep(3)  # Wait for pages to load after refresh
-
-            if use_continuous_monitoring:
-                # Use continuous monitoring - keeps checking until queue numbers appear
-                queue_data = self.monitor_tabs_continuously(
-                    queue_pattern=queue_pattern,
+            self.setup()
+
+            while True:
+                self.cycle(
+                    use_continuous_monitoring=use_continuous_monitoring,
                     check_interval=check_interval,
-                    max_attempts=max_attempts
+                    max_attempts=max_attempts,
+                    use_cookie_editor=use_cookie_editor,
+                    cookie_editor_id=cookie_editor_id,
+                    pause_before_cookies=pause_before_cookies,
+                    clear_cookies_before_refresh=clear_cookies_before_refresh,
+                    max_check_interval=max_check_interval
                 )
-            else:
-                # Single scan only
-                queue_data = self.scan_queue_numbers(queue_pattern=queue_pattern)
-
-            self.find_best_tab(queue_data)
+                pause_before_cookies = False  # Manual setup is only needed once
 
-            print("\nProcess complete! Browser will remain open.")
-            print("Close the browser manually when done.")
+                print("\nProcess complete! Browser will remain open.")
 
-            # Keep browser open
-            input("\nPress Enter to close the browser...")
+                # Keep browser open, optionally reusing it for another cycle
+                choice = input("\nPress Enter to close the browser, or type 'r' and Enter to run again...")
+                if choice.strip().lower() != 'r':
+                    break
+                self.reset_tabs()
 
         except Exception as e:
             print(f"Error during execution: {str(e)}")
         finally:
-            if self.driver:
-                self.driver.quit()
-                print("Browser closed.")
+            self.shutdown()
 
 
 def main():
@@ -490,19 +1487,25 @@ def main():
     # The pattern looks for the text and then captures the number that appears after it
     QUEUE_PATTERN = r'Number of users in line ahead of you:[\s\S]*?(\d+)'
 
+    # Optional: CSS selector of the element that holds the queue number
+    # When set, only that element is read instead of matching QUEUE_PATTERN on the whole page
+    QUEUE_SELECTOR = None
+
     # Create and run queue manager
     manager = QueueManager(
         url=TARGET_URL,
         num_tabs=NUM_TABS,
-        chrome_profile_path=CHROME_PROFILE
+        chrome_profile_path=CHROME_PROFILE,
+        queue_pattern=QUEUE_PATTERN,
+        queue_selector=QUEUE_SELECTOR
     )
 
     manager.run_full_cycle(
-        queue_pattern=QUEUE_PATTERN,
         use_cookie_editor=USE_COOKIE_EDITOR,
         cookie_editor_id=COOKIE_EDITOR_ID,
         pause_before_cookies=False,  # No pause needed when using Selenium method
-        max_attempts=1000  # Maximum number of monitoring attempts
+        max_check_interval=30,  # Slow checks down to every 30 seconds while no tab shows a number (5 = no backoff)
+        max_attempts=1000  # Maximum number of monitoring attempts (up to ~8.3 hours with backoff)
     )
 
 